@@ -1,6 +1,6 @@
 #
 # SUMMARY:      Interface to make instances callable as functions
-# USAGE:        inherit from Callable
+# USAGE:        inherit from Callable; test with: python callable.py
 # KEYWORDS:     function, instance, interface
 #
 # AUTHOR:       Robert Weiner
@@ -17,19 +17,163 @@ called as functions with an arbitrary number of arguments.
 ## Required modules
 ## ------------------------------------------------------------------------
 
+import ctypes
+from collections import namedtuple
+import interface
 from interface import *
 
+# Export this module's interface along with those of "interface", as before,
+# but not the modules and names imported here.
+__all__ = interface.__all__ + ['Callable', 'NativeCall']
+
+# Address and signature of a C function implementing a Callable body; see
+# "Callable.register_native".
+NativeCall = namedtuple('NativeCall', 'pointer signature')
+
 
 ## ------------------------------------------------------------------------
 ## Interfaces
 ## ------------------------------------------------------------------------
 
 class Callable(Interface):
+    """
+    Interface for instances which may be called as functions.
+    Specifies the following method:
+         iself(arg1, arg2, ...)      or   iself.__call__(arg1, arg2, ...)
+
+    Since __call__ has no pre- or post-conditions, an implementor's
+    __call_body__ becomes its __call__ method (see "InterfaceMeta"), so calls
+    go straight to the body with its own signature and, unless the body takes
+    *args, no tuple of arguments is built.
+
+    C code which calls an instance many times over, such as a numerical
+    integrator, may instead fetch its `__nativecall__' record once and call
+    the body through its function pointer; see "register_native".
+    """
+    __slots__ = ()
+
+    # Raise a clear exception if this method is called before an implementor
+    # redefines it.
+    __call_body__ = Interface.error
+
+    # A NativeCall record when the body has a native implementation, else None.
+    __nativecall__ = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if '__call_body__' in cls.__dict__:
+            cls._body_changed('__call_body__')
 
+    @classmethod
+    def _body_changed(cls, body_name):
+        "Keep `__nativecall__' in step with the __call_body__ of `cls' when it is defined, rebound or deleted."
+        super()._body_changed(body_name)
+        if body_name != '__call_body__':
+            return
+        body = cls.__dict__.get('__call_body__')
+        if body is None:
+            # Deleting the body reverts to the inherited body and its native record.
+            if cls is not Callable and '__nativecall__' in cls.__dict__:
+                del cls.__nativecall__
+        else:
+            # A new body invalidates any native record of the previous one; a body
+            # compiled with "native_body" registers its own.
+            cls.__nativecall__ = None
+            native = getattr(body, 'native', None)
+            if native is not None:
+                cls.register_native(native.address, body.signature)
+
+    @classmethod
+    def register_native(cls, func_ptr, signature):
+        """
+        Record `func_ptr', a C function implementing the __call_body__ of `cls', in `cls.__nativecall__'.
+        Require: `func_ptr' is an address or ctypes function pointer; the function takes the
+                 arguments of __call_body__ other than `self' with types given by `signature',
+                 e.g. "float64(float64)".
+        Callers check getattr(obj, '__nativecall__', None) once and, if it is set, call
+        its `pointer' directly rather than calling `obj' for every argument set.
+        """
+        cls.__nativecall__ = NativeCall(ctypes.cast(func_ptr, ctypes.c_void_p), signature)
+
+    @plain_stub
     def __call__(iself, *args):
         """
         Invoked when the instance is ``called'' as a function.
         If this method is defined, x(arg1, arg2, ...) is a shorthand
         for x.__call__(arg1, arg2, ...).
         """
-        return apply(iself.__call_body__, args)
+        # Reached only when __call_body__ is undefined or is not a plain function,
+        # e.g. a staticmethod or classmethod, which only the instance can bind.
+        return iself.__call_body__(*args)
+
+
+## ------------------------------------------------------------------------
+## Private functions
+## ------------------------------------------------------------------------
+
+def __test():
+    "Test Callable interface and print results."
+    class Double(Callable):
+        def __init__(self): pass
+        def __call_body__(self, x): return 2 * x
+    assert_implements(Double)
+
+    class Sum(Callable):
+        def __init__(self): pass
+        def __call_body__(self, *args): return sum(args)
+    assert_implements(Sum)
+
+    class NoCall(Callable):
+        def __init__(self): pass
+
+    # Bodies may be descriptors other than functions, which stay behind the __call__ stub.
+    class Negate(Callable):
+        def __init__(self): pass
+        __call_body__ = staticmethod(lambda x: -x)
+
+    class Name(Callable):
+        def __init__(self): pass
+        __call_body__ = classmethod(lambda cls, suffix: cls.__name__ + suffix)
+
+    # A C callback standing in for a natively compiled Double body.
+    c_double_fn = ctypes.CFUNCTYPE(ctypes.c_double, ctypes.c_double)
+    native_double = c_double_fn(lambda x: 2 * x)
+    Double.register_native(native_double, 'float64(float64)')
+
+    # A body inherited from a mixin which is not an interface, later rebound to a non-function.
+    class Mixin:
+        def __call_body__(self, x): return x
+    class Identity(Mixin, Callable):
+        def __init__(self): pass
+    identity_conforms = implements(Identity, Callable)
+    Mixin.__call_body__ = 5
+
+    # Rows of (description, actual result, expected result); later rows follow
+    # the rebinding of Double's body.
+    checks = [("class Double implements Callable", implements(Double, Callable), True),
+              ("class NoCall implements Callable", implements(NoCall, Callable), False),
+              ("Double()(21)", Double()(21), 42),
+              ("Double's body is bound as its __call__", Double.__call__ is Double.__call_body__, True),
+              ("Sum()(1, 2, 3)", Sum()(1, 2, 3), 6),
+              ("staticmethod body Negate()(2)", Negate()(2), -2),
+              ("classmethod body Name()('!')", Name()('!'), 'Name!'),
+              ("class Identity implements Callable", identity_conforms, True),
+              ("check_implements(Identity) reports its rebound mixin body",
+               check_implements(Identity) is not None, True),
+              ("Double's native call of 21.0", c_double_fn(Double.__nativecall__.pointer.value)(21.0), 42.0)]
+    Double.__call_body__ = lambda self, x: 3 * x
+    checks += [("rebound Double()(21)", Double()(21), 63),
+               ("rebound Double's native record", Double.__nativecall__, None)]
+    for desc, actual, expected in checks:
+        if actual == expected:
+            print("Success - %s: %s" % (desc, expected))
+        else:
+            print("  FAILURE - %s: %s, instead of %s" % (desc, actual, expected))
+
+
+## ------------------------------------------------------------------------
+## Program execution
+## ------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    __test()
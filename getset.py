@@ -36,15 +36,42 @@ class GetSet(Interface):
          del iself.attrname          or   delattr(iself, attrname)
          iself.attrname              or   getattr(iself, attrname)
          iself.attrname = attrvalue  or   setattr(iself, attrname, attrvalue)
+
+    An implementor may set `_passthrough_attrs' to a collection of attribute
+    names whose assignment should bypass its __setattr_body__ and store the
+    value directly with object.__setattr__, e.g. for plain instance state.
+    A __setattr__ which the implementor defines itself takes precedence.
+
+    Since these methods have no pre- or post-conditions, each body which an
+    implementor defines becomes the corresponding method (see "InterfaceMeta"),
+    so attribute access calls the body without passing through a stub.
     """
+    __slots__ = ()
+
     # Raise a clear exception if these methods are called before an implementor
     # redefines them.
     __delattr_body__ = __getattr_body__ = __setattr_body__ = Interface.error
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if '_passthrough_attrs' in cls.__dict__ and '__setattr__' not in cls.__dict__:
+            passthrough = frozenset(cls._passthrough_attrs)
+            def __setattr__(self, name, value):
+                if name in passthrough:
+                    object.__setattr__(self, name, value)
+                else:
+                    self.__setattr_body__(name, value)
+            cls.__setattr__ = __setattr__
+
+    # Each stub calls its body as an attribute of `iself', so a body may also be a
+    # staticmethod, classmethod or other descriptor.  Every implementor inherits
+    # some body, so these lookups never re-enter __getattr__.
+    @plain_stub
     def __delattr__(iself, name):
         "Implement: attribute deletion, del iself.name."
-        __delattr_body__(iself, name)
+        iself.__delattr_body__(name)
 
+    @plain_stub
     def __getattr__(iself, name):
         """
         Implement: attribute retrieval, iself.name.
@@ -52,8 +79,9 @@ class GetSet(Interface):
         Raise:     AttributeError when `name' is not found.
         Called only when an instance attribute or class attribute lookup fails.
         """
-        return __getattr_body__(iself, name)
+        return iself.__getattr_body__(name)
 
+    @plain_stub
     def __setattr__(iself, name, value):
         """
         Implement: attribute storage, iself[name] = value.
@@ -61,7 +89,7 @@ class GetSet(Interface):
         To assign to an instance attribute within this method,
         use: self.__dict__[name] = value.
         """
-        __setattr_body__(iself, name, value)
+        iself.__setattr_body__(name, value)
 
 
 ## ------------------------------------------------------------------------
@@ -70,6 +98,7 @@ class GetSet(Interface):
 
 def __test():
     "Test GetSet interface and print results."
+    import gc, weakref
     class G(GetSet):
         def __init__(self): pass
         def __delattr_body__(self, name): return 0
@@ -80,35 +109,71 @@ def __test():
     class NoG(GetSet):
         def __init__(self): pass
 
-    if implements(G, GetSet):
-        print("Success - class G implements GetSet")
-    else:
-        print("  FAILURE - class G fails to implement GetSet")
-
-    if implements(NoG, GetSet):
-        print("  FAILURE - class NoG implements GetSet")
-    else:
-        print("Success - class NoG fails to implement GetSet")
-
     g = G(); noG = NoG()
-    if implements(g, GetSet):
-        print("Success - instance g implements GetSet")
-    else:
-        print("  FAILURE - instance g fails to implement GetSet")
-
-    if implements(noG, GetSet):
-        print("  FAILURE - instance noG implements GetSet")
-    else:
-        print("Success - instance noG fails to implement GetSet")
+    # Rows of (class or instance, its description, whether it should implement GetSet)
+    checks = [(G, "class G", True), (NoG, "class NoG", False),
+              (g, "instance g", True), (noG, "instance noG", False)]
+    for obj, desc, expected in checks:
+        if implements(obj, GetSet) == expected:
+            print("Success - %s %s GetSet" % (desc, expected and "implements" or "fails to implement"))
+        else:
+            print("  FAILURE - %s %s GetSet" % (desc, expected and "fails to implement" or "implements"))
 
     if assert_implements(G):
         print("Success - assert_implements(G)")
 
-    try:
-        assert_implements(NoG)
-        print("  FAILURE - assert_implements(noG) did not trigger an InterfaceError")
-    except InterfaceError:
-        print("Success - assert_implements(noG) triggered an InterfaceError")
+    if check_implements(NoG):
+        print("Success - check_implements(NoG) reported non-conformance")
+    else:
+        print("  FAILURE - check_implements(NoG) reported no non-conformance")
+
+    # Assignments to `_passthrough_attrs' bypass __setattr_body__, which doubles values here,
+    # unless the class defines its own __setattr__, which triples them.
+    class P(GetSet):
+        _passthrough_attrs = ('x',)
+        def __init__(self): self.x = 1
+        def __delattr_body__(self, name): del self.__dict__[name]
+        def __getattr_body__(self, name): raise AttributeError(name)
+        def __setattr_body__(self, name, value): self.__dict__[name] = 2 * value
+    class Q(P):
+        _passthrough_attrs = ('x',)
+        def __setattr__(self, name, value): self.__dict__[name] = 3 * value
+    # Bodies may be descriptors other than functions, e.g. staticmethods.
+    class S(GetSet):
+        _passthrough_attrs = ('x',)
+        def __init__(self): self.x = 1
+        __delattr_body__ = staticmethod(lambda name: None)
+        __getattr_body__ = staticmethod(str.upper)
+        __setattr_body__ = staticmethod(lambda name, value: None)
+    p, q, s = P(), Q(), S()
+    p.y = 1
+    s.y = 1
+
+    # Checking a class against an interface it does not inherit memoizes nothing
+    # which would keep a dynamically created interface alive.
+    class Dynamic(Interface): pass
+    dynamic_ref = weakref.ref(Dynamic)
+    implements(int, Dynamic)
+    del Dynamic
+    gc.collect()
+    # Rows of (description, actual result, expected result)
+    checks = [("G's __delattr_body__ is bound as its __delattr__", G.__delattr__ is G.__delattr_body__, True),
+              ("G's __getattr_body__ is bound as its __getattr__", G.__getattr__ is G.__getattr_body__, True),
+              ("G's __setattr_body__ is bound as its __setattr__", G.__setattr__ is G.__setattr_body__, True),
+              ("passthrough attribute p.x", p.x, 1),
+              ("attribute p.y set through __setattr_body__", p.y, 2),
+              ("staticmethod __getattr_body__ of s.name", s.name, 'NAME'),
+              ("passthrough attribute s.x", s.x, 1),
+              ("attribute s.y discarded by staticmethod __setattr_body__", s.y, 'Y'),
+              ("passthrough attribute q.x set through Q's own __setattr__", q.x, 3),
+              ("interface Dynamic collected after implements(int, Dynamic)", dynamic_ref() is None, True),
+              ("flatten", flatten(('a', ['b', ('c',)]), {'k': 'd'}, None, set(), 'e'), ['a', 'b', 'c', 'd', 'e']),
+              ("unique", unique([3, 1], (1, 2), 3), [3, 1, 2])]
+    for desc, actual, expected in checks:
+        if actual == expected:
+            print("Success - %s: %s" % (desc, expected))
+        else:
+            print("  FAILURE - %s: %s, instead of %s" % (desc, actual, expected))
 
 
 ## ------------------------------------------------------------------------
@@ -1,6 +1,6 @@
 #
 # SUMMARY:      Basic interfaces for most class instances
-# USAGE:        inherit from Comparable, Hashable, or Instantiable
+# USAGE:        inherit from Comparable, Hashable, or Instantiable; test with: python instantiable.py
 # KEYWORDS:     class, dictionary, instance, interface, overload
 #
 # AUTHOR:       Robert Weiner
@@ -19,37 +19,57 @@ Basic interfaces implemented by most classes:
 ## Required modules
 ## ------------------------------------------------------------------------
 
+from functools import total_ordering
+import interface
 from interface import *
 
+# Export this module's interfaces along with those of "interface", as before,
+# but not the names imported here.
+__all__ = interface.__all__ + ['Comparable', 'Hashable', 'Instantiable']
+
 
 ## ------------------------------------------------------------------------
 ## Interfaces
 ## ------------------------------------------------------------------------
 
 # Comparable
+@total_ordering
 class Comparable(Interface):
     """
     Interface for instances which are less-than, equal-to or greater-than each other.
     Specifies the following methods:
-         iself.__cmp__(other)        - return whether `iself' is <, ==, or > `other'
-         iself.__rcmp__(other)       - return whether `other' is <, ==, or > `iself'
+         iself.__eq__(other)         - return whether `iself' == `other'
+         iself.__lt__(other)         - return whether `iself' < `other'
+    The remaining comparisons are derived from these: != negates ==, and <=, >
+    and >= are supplied by functools.total_ordering.
     """
+    __slots__ = ()
+
     # Raise a clear exception if these methods are called before an implementor
     # redefines them.
-    __cmp_body__ = __rcmp_body__ = Interface.error
+    __eq_body__ = __lt_body__ = Interface.error
+
+    @plain_stub
+    def __eq__(iself, other):
+        """
+        Return: True if `iself' is equal to `other', else False.
 
-    def __cmp__(iself, other):
+        Called by the == and != operators.  Return NotImplemented if `other'
+        cannot be compared with `iself', so that Python tries `other' == `iself'
+        instead and, failing that, compares the objects by identity.
         """
-        Return: a negative, zero or positive number based on whether `iself' is <, ==, or > `other'.
+        return iself.__eq_body__(other)
 
-        Called by all comparison operations.  If no __cmp__() operation
-        is defined, class instances are compared by object identity (address).
+    @plain_stub
+    def __lt__(iself, other):
         """
-        __cmp_body__(iself, other)
+        Return: True if `iself' is less than `other', else False.
 
-    def __rcmp__(iself, other):
-        "Return: a negative, zero or positive number based on whether `other' is <, ==, or > `iself'."
-        __rcmp_body__(iself, other)
+        Called by the < operator and by the derived <=, > and >= operators.
+        Return NotImplemented if `other' cannot be compared with `iself', so
+        that Python tries `other' > `iself' instead.
+        """
+        return iself.__lt_body__(other)
 
 
 # Hashable
@@ -69,10 +89,13 @@ class Hashable(Comparable):
     requires that a key's hash value be immutable (if the object's hash
     value changes, it will be in the wrong hash bucket).
     """
+    __slots__ = ()
+
     # Raise a clear exception if this method is called before an implementor
     # redefines it.
     __hash_body__ = Interface.error
 
+    @plain_stub
     def __hash__(iself):
         """
         Return: a hash code for `iself' typically for use in dictionary lookups.
@@ -84,7 +107,7 @@ class Hashable(Comparable):
         components of the object which play a part in equality
         comparisons.
         """
-        __hash_body__(iself)
+        return iself.__hash_body__()
 
 # Instantiable
 class Instantiable(Interface):
@@ -92,15 +115,36 @@ class Instantiable(Interface):
     Standard interface of overloadable instance methods to which most classes should conform.
     Specifies the following methods:
          iself.__init__([, args...]) - initialize `iself' upon creation (inherited from "Interface")
+         iself.__bool__()            - return False to treat an instance as logically false, else True
          iself.__del__()             - delete `iself'
-         iself.__nonzero__()         - return 0 to treat an instance as logically false, else true
          iself.__repr__()            - return string representation useful in reconstruction of `iself'
          iself.__str__()             - return a printable string representation of `iself'
+
+    __bool__, __del__, __repr__ and __str__ have no pre- or post-conditions,
+    so the bodies which an implementor defines for them become those methods
+    (see "InterfaceMeta").
     """
+    __slots__ = ()
+
     # Raise a clear exception if these methods are called before an implementor
     # redefines them.
-    __del_body__ = __nonzero_body__ = __repr_body__ = __str_body__ = Interface.error
+    __bool_body__ = __del_body__ = __repr_body__ = __str_body__ = Interface.error
 
+    @plain_stub
+    def __bool__(iself):
+        """
+        Return: False to treat an instance as logically false, else True.
+        Implement: object truth-value testing, e.g. if `iself' ...
+
+        When this method's body is not defined, __len__() is called instead,
+        if it is defined: an implementor which defines __len__() but not
+        __bool_body__() is given a body which returns True unless its length
+        is zero.  If a class defines neither __len__() nor __bool__(), all its
+        instances are considered true.
+        """
+        return iself.__bool_body__()
+
+    @plain_stub
     def __del__(iself):
         """
         Implement: instance deletion, del iself.
@@ -126,19 +170,9 @@ class Instantiable(Interface):
         globals exist, this may help in assuring that imported modules
         are still available at the time the __del__() method is called.
         """
-        __del_body__(iself)
-
-    def __nonzero__(iself):
-        """
-        Return: 0 to treat an instance as logically false, else return 1 for true.
-        Implement: object truth-value testing, e.g. if `iself' ...
-
-        When this method is not defined, __len__() is called instead, if it is
-        defined. If a class defines neither __len__() nor __nonzero__(),
-        all its instances are considered true.
-        """
-        __nonzero_body__(iself)
+        iself.__del_body__()
 
+    @plain_stub
     def __repr__(iself):
         """
         Return: string representation useful in reconstruction of `iself'.
@@ -153,9 +187,10 @@ class Instantiable(Interface):
         similar object instead produce a string of the form "<...some
         useful description...>".
         """
-        __repr_body__(iself)
+        return iself.__repr_body__()
 
-    def __str__(self):
+    @plain_stub
+    def __str__(iself):
         """
         Return: a printable string representation of `iself'.
 
@@ -165,4 +200,73 @@ class Instantiable(Interface):
         to be a valid Python expression: a more convenient or concise
         representation may be used instead.
         """
-        __str_body__(iself)
+        return iself.__str_body__()
+
+
+## ------------------------------------------------------------------------
+## Private functions
+## ------------------------------------------------------------------------
+
+def __test():
+    "Test Comparable, Hashable and Instantiable interfaces and print results."
+    class Version(Hashable):
+        def __init__(self, number): self.number = number
+        def __eq_body__(self, other): return self.number == other.number
+        def __lt_body__(self, other): return self.number < other.number
+        def __hash_body__(self): return hash(self.number)
+    assert_implements(Version)
+
+    class Point(Instantiable):
+        def __init__(self, x): self.x = x
+        def __del_body__(self): pass
+        def __repr_body__(self): return 'Point(%r)' % self.x
+        def __str_body__(self): return str(self.x)
+
+    # Bodies may be descriptors other than functions, e.g. classmethods.
+    class Origin(Instantiable):
+        def __init__(self): pass
+        def __del_body__(self): pass
+        __repr_body__ = classmethod(lambda cls: cls.__name__ + '()')
+
+    # Instantiable's __bool__ falls back on a __len__ defined or inherited by an implementor.
+    class Queue(Instantiable):
+        def __init__(self, length): self.length = length
+        def __len__(self): return self.length
+        def __del_body__(self): pass
+    class Stack(list, Instantiable):
+        def __init__(self, *items): list.__init__(self, items)
+        def __del_body__(self): pass
+
+    v1, v2 = Version(1), Version(2)
+    # Rows of (description, actual result, expected result)
+    checks = [("Version(1) < Version(2)", v1 < v2, True),
+              ("Version(2) >= Version(1) via total_ordering", v2 >= v1, True),
+              ("Version(2) <= Version(1) via total_ordering", v2 <= v1, False),
+              ("Version(1) != Version(2)", v1 != v2, True),
+              ("equal Versions hash alike", len({v1, Version(1)}), 1),
+              ("class Version implements Comparable and Hashable", implements(Version, Comparable, Hashable), True),
+              ("instance v1 implements Hashable and Instantiable", implements(v1, Hashable, Instantiable), False),
+              ("class Version implements non-interface int", implements(Version, Hashable, int), False),
+              ("repr(Point(1))", repr(Point(1)), 'Point(1)'),
+              ("str(Point(1))", str(Point(1)), '1'),
+              ("Point's __repr_body__ is bound as its __repr__", Point.__repr__ is Point.__repr_body__, True),
+              ("Point's __del_body__ is bound as its __del__", Point.__del__ is Point.__del_body__, True),
+              ("classmethod __repr_body__ of Origin()", repr(Origin()), 'Origin()'),
+              ("empty Queue is false", bool(Queue(0)), False),
+              ("non-empty Queue is true", bool(Queue(2)), True),
+              ("empty Stack with inherited __len__ is false", bool(Stack()), False),
+              ("non-empty Stack with inherited __len__ is true", bool(Stack(1)), True),
+              ("Queue's __len__ fallback is bound as its __bool__", Queue.__bool__ is Queue.__bool_body__, True)]
+    for desc, actual, expected in checks:
+        if actual == expected:
+            print("Success - %s: %s" % (desc, expected))
+        else:
+            print("  FAILURE - %s: %s, instead of %s" % (desc, actual, expected))
+
+
+## ------------------------------------------------------------------------
+## Program execution
+## ------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    __test()
@@ -0,0 +1,46 @@
+# FILE:         interface.pxd
+#
+# SUMMARY:      Cython declarations which augment interface.py when it is compiled to a C extension
+# USAGE:        cythonize -i interface.py
+# KEYWORDS:     interface, performance
+#
+# AUTHOR:       Robert Weiner
+# LICENSE:      Available under the terms of the MIT License
+#
+# DESCRIPTION:
+#
+# interface.py remains plain Python and runs unchanged without Cython
+# (e.g. under PyPy).  When it is compiled, Cython reads these declarations
+# to type the conformance caches and to turn the private conformance
+# helpers, which run for every class and interface checked, into C
+# functions.  Keep them in sync with the definitions in interface.py.
+#
+# DESCRIP-END.
+
+import cython
+
+## ------------------------------------------------------------------------
+## Private variables
+## ------------------------------------------------------------------------
+
+cdef object _implements_cache
+cdef object _MISSING
+cdef object _stub_cache
+
+## ------------------------------------------------------------------------
+## Private functions
+## ------------------------------------------------------------------------
+
+cdef bint __implements(aClass, interface) except -1
+
+@cython.locals(implemented_a_method=bint, body_method_unimplemented=bint,
+               istub_tuples=tuple)
+cdef bint __implements_stubs(aClass, interface) except -1
+
+cdef tuple __interface_stubs(interface)
+
+cdef bint _is_function(obj) except -1
+
+cdef bint _is_stub(method) except -1
+
+cdef bint _is_unimplemented(body_method) except -1
@@ -22,6 +22,10 @@ argument).
      assert_implements(aClass)
          call after a class definition to assert interface conformance
 
+     check_implements(aClass)
+         return None if a class implements all of its interfaces, else a string of
+         non-conformance issues, one per line; never raises an InterfaceError
+
      extends(interface, *interfaces):
          boolean test of whether an interface extends one or more other interfaces (via inheritance);
          this is false if any arg is not an interface
@@ -45,16 +49,24 @@ argument).
      is_interface(obj)
          boolean test of whether `obj' is an interface or class of interface
 
+     native_body(signature)
+         return a decorator which compiles a numeric body method to a C callback with numba
+         (an optional dependency), for use by C callers such as numerical integrators
+
+     plain_stub(stub)
+         decorator marking an interface stub as having no pre- or post-conditions, so
+         implementors' body methods are called directly in its place
+
      -----
 
      ancestor_names(obj, exclude_interfaces=0)
          return a list of ancestor class or interface names of `obj' (class, interface or instance),
-         including `obj' itself; ancestors are returned in depth-first order, left to right;
+         including `obj' itself; ancestors are returned in method resolution order (that of `__mro__');
          with optional `exclude_interfaces', interface ancestors are removed
 
      ancestors(obj, exclude_interfaces=0)
          return a list of ancestor class or interface objects of `obj' (class, interface or instance),
-         including `obj' itself; ancestors are returned in depth-first order, left to right;
+         including `obj' itself; ancestors are returned in method resolution order (that of `__mro__');
          with optional `exclude_interfaces', interface ancestors are removed
 
      flatten (*objs)
@@ -72,37 +84,117 @@ argument).
 ## ------------------------------------------------------------------------
 
 import sys
-from types import *
-from inspect import isclass
-
-def require_python_version(min_version):
-    """
-    Raises an error if Python version is less than `min_version'.
-    Require: `min_version' is a float or string of only digits and periods
-    Return:  python version number split into a tuple
-    Raise:   SystemError if Python version is less than `min_version'.
-    """
-    assert type(min_version) in (float, str)
+from types import FunctionType
+from inspect import CO_VARARGS, isclass
+from weakref import WeakKeyDictionary
+
+if sys.version_info < (3, 8):
+    raise SystemError("(%s): Requires Python 3.8 or greater; running Python %s" % \
+                      (__name__, sys.version.split()[0]))
+
+# Names exported by "from interface import *": the classes and public functions
+# documented above, but not the modules and names imported here.
+__all__ = ['Interface', 'InterfaceError',
+           'assert_implements', 'check_implements', 'extends', 'implements',
+           'interface_body_name', 'interface_names', 'interfaces', 'is_interface',
+           'native_body', 'plain_stub',
+           'ancestor_names', 'ancestors', 'flatten', 'unique']
 
-    if type(min_version) is float:
-        # Don't use `min_version` here since has a buggy float conversion in V2.0.
-        min_version = "%s" % min_version   
-    # python_version_tuple would be (2, 0) for 2.0 final, for example
-    python_version_tuple = tuple(map(int, sys.version.split()[0].split('.')))
-    min_version_tuple = tuple(map(int, min_version.split('.')))
-    if python_version_tuple >= min_version_tuple:
-        return python_version_tuple
+## ------------------------------------------------------------------------
+## Private variables
+## ------------------------------------------------------------------------
 
-    raise SystemError("(%s): Requires Python %s or greater; running Python %s" % \
-          (__name__, min_version, sys.version[0].split()))
-                              
-require_python_version('3.0.0')
+# Conformance results memoized by "implements", as {class: {interface: bool}}.
+# Classes are weakly referenced, so that classes created dynamically may still
+# be garbage collected; each class's results cover only interfaces it inherits,
+# which it references anyway.  Whenever a stub or body method of an interface or
+# implementor is rebound or deleted, InterfaceMeta drops the results of that class
+# and its subclasses, since that may change which interfaces they implement.
+# Rebinding a method of a mixin which is not an interface goes unnoticed, so the
+# results of its subclasses may go stale; "check_implements" and
+# "assert_implements" therefore recheck a class from scratch.  Class hierarchies
+# are assumed not to change once defined, i.e. __bases__ is never reassigned.
+_implements_cache = WeakKeyDictionary()
+
+# Default for attribute lookups, distinguishing a missing attribute from one whose value is None.
+_MISSING = object()
+
+# Stub methods declared by each interface, as
+# {interface: ((stub_name, stub_method, stub_argcount, body_name), ...)}.
+# These entries are the one-time, per-interface part of every conformance check,
+# so checking a class costs two attribute lookups and an argument count comparison
+# per stub.  Interfaces are weakly referenced, like classes in `_implements_cache';
+# InterfaceMeta drops an interface's entry whenever one of its stub or body
+# methods is rebound or deleted.
+_stub_cache = WeakKeyDictionary()
 
 ## ------------------------------------------------------------------------
 ## Classes
 ## ------------------------------------------------------------------------
 
-class Interface:
+class InterfaceMeta(type):
+    """
+    Metaclass of "Interface" and thus of all interfaces and their implementors.
+
+    Stubs marked with "plain_stub" do nothing but pass their arguments on to
+    their body methods.  Each class which defines a body method for such a stub
+    has the stub replaced by the body itself, so calls (including special method
+    slots such as __call__ or __hash__) dispatch straight to the implementor's
+    code without an intervening stub frame.  Other stubs are always kept, since
+    they may do more than check assertions, e.g. convert results or supply
+    argument defaults, and a program must behave the same with "python -O".
+
+    Unreplaced stubs call their bodies as ordinary attributes of `iself', e.g.
+    iself.__repr_body__(), so a body may be any descriptor, such as a
+    staticmethod; CPython caches attribute lookups on types, so this costs less
+    than indexing a per-class table of body methods would.
+
+    A class may have only one metaclass, so to mix an interface with a class
+    of another metaclass, such as abc.ABC, first derive a metaclass from both:
+
+        class ABCInterfaceMeta(InterfaceMeta, abc.ABCMeta): pass
+        class Shape(abc.ABC, GetSet, metaclass=ABCInterfaceMeta): ...
+    """
+
+    def __init__(cls, name, bases, namespace, **kwargs):
+        super().__init__(name, bases, namespace, **kwargs)
+        # "Interface" itself (the only class without bases) inherits no stubs.
+        if not bases:
+            return
+        # Give each body which this class leaves unimplemented its own error method,
+        # whose message names the method.
+        for body_name, body_method in namespace.items():
+            if body_method is Interface.error:
+                setattr(cls, body_name, _unimplemented_body(cls, body_name))
+        # Python tests the truth of objects without __bool__ by their __len__; a
+        # __bool__ stub without a body would raise instead, so follow Python's rule.
+        if getattr(cls, '__len__', None) is not None \
+           and _is_unimplemented(getattr(cls, '__bool_body__', None)):
+            cls.__bool_body__ = _bool_from_len
+        _install_bodies(cls)
+
+    def __setattr__(cls, name, value):
+        installed = _uninstall_body(cls, name)
+        affects_conformance = _affects_conformance(cls, name, value)
+        super().__setattr__(name, value)
+        if installed:
+            _install_body(cls, name, value)
+        if affects_conformance:
+            _forget_conformance(cls)
+        if _interface_stub_name(name):
+            cls._body_changed(name)
+
+    def __delattr__(cls, name):
+        _uninstall_body(cls, name)
+        affects_conformance = _affects_conformance(cls, name, None)
+        super().__delattr__(name)
+        if affects_conformance:
+            _forget_conformance(cls)
+        if _interface_stub_name(name):
+            cls._body_changed(name)
+
+
+class Interface(metaclass=InterfaceMeta):
     """
     A protocol to which classes may conform by implementing its method signatures, pre- and post- conditions and attributes.
     This is the top-level class from which all interfaces inherit.
@@ -138,13 +230,22 @@ class Interface:
 
        it or its ancestors redefine/implement all of the stub or body methods
        declared by the interface, keeping the number of arguments per method the
-       same and renaming the first arg of each stub method from `iself' to `self';
+       same (any number, if the stub takes *args) and renaming the first arg of
+       each stub method from `iself' to `self';
       
        and its definition is followed by a call to:
           assert_implements(aClass)
        this marks the class as a non-interface and confirms that it does in fact
        implement the interfaces from which it inherits.
+
+    Interfaces declare empty __slots__, so an implementor which also declares
+    __slots__ has instances without a per-instance __dict__, saving memory
+    and speeding attribute access.  Such an implementor must list "__dict__"
+    among its __slots__ to use functools.cached_property, which stores its
+    value in the instance __dict__, and "__weakref__" to be weakly
+    referenced.
     """
+    __slots__ = ()
 
     ## Interface attributes
 
@@ -155,9 +256,18 @@ class Interface:
 
     # Interfaces set their method stub bodies to this method so that an error is 
     # triggered if an implementor fails to redefine the stub and mistakenly calls
-    # the stub method.
+    # the stub method.  InterfaceMeta replaces each such body with one whose
+    # error message also names the method.
     def error(self, *unused):
-        raise InterfaceError("(%s): failed to implement the above interface stub method" % self.__name__)
+        raise InterfaceError("(%s): failed to implement the above interface stub method" % type(self).__name__)
+
+    @classmethod
+    def _body_changed(cls, body_name):
+        """
+        Called by "InterfaceMeta" after body method `body_name' of `cls' is rebound or deleted.
+        Interfaces which keep state derived from a body override this to bring it up to date.
+        """
+        pass
 
     # Define this method in each interface to prevent instantiation of interfaces.
     def __init__(self, *args):
@@ -206,62 +316,13 @@ def assert_implements(aClass):
     if not (isclass(aClass) or is_interface(aClass)):
         raise TypeError("(assert_implements): aClass arg `%s' is not a class" % aClass)
 
-    # Add all ancestor interfaces to the implementation check
-    interface_list = interfaces(aClass)
-    errors = []
-    for interface in interface_list:
-        idict = interface.__dict__
-
-        # Set istub_tuples to interface's stub methods given as (name, method) tuples.
-        # Remove non-stub attributes and body methods.
-        istub_tuples = [item for item in idict.items() \
-                        if type(item[1]) is FunctionType and \
-                        item[1].__code__.co_varnames[0] is 'iself']
-
-        # Ensure all interface stub methods are redefined by the current class
-        # and that the number of arguments to each remains the same.
-        for stub_name, stub_method in istub_tuples:
-            body_name = interface_body_name(stub_name)
-            impl_method = getattr(aClass, stub_name)
-            try:
-                if hasattr(aClass, body_name):
-                    body_method = getattr(aClass, body_name)
-                    body_argcount = body_method.__code__.co_argcount
-                else:
-                    body_method = body_argcount = None
-
-                body_method_unimplemented = body_method and body_method is Interface.error \
-                                            or issubclass(interface, body_method.__class__)
-                if impl_method is stub_method and not body_method or body_method_unimplemented:
-                    # method is not implemented
-                    errors.append("(%s): failed to define %s interface method %s or %s" % \
-                                  (aClass.__name__, interface.__name__, body_name, stub_name))
-
-                impl_method_argcount = impl_method.__code__.co_argcount
-                stub_argcount = stub_method.__code__.co_argcount
-                if impl_method != stub_method and impl_method_argcount != stub_argcount:
-                    # impl_method has wrong number of args
-                    errors.append("(%s.%s): takes %d args, instead of %d specified by %s.%s" % \
-                                  (aClass.__name__, stub_name, impl_method_argcount, \
-                                   stub_argcount, interface.__name__, stub_name))
-                elif body_method and not body_method_unimplemented and body_argcount != stub_argcount:
-                    # body_method has wrong number of args
-                    errors.append("(%s.%s): takes %d args, instead of %d specified by %s.%s" % \
-                                  (aClass.__name__, body_name, body_argcount,
-                                   stub_argcount, interface.__name__, body_name))
-
-            except AttributeError:
-                if hasattr(aClass, stub_name) or hasattr(aClass, body_name):
-                    pass
-                else:
-                    errors.append("(%s): failed to define %s interface method %s or %s" % \
-                                  (aClass.__name__, interface.__name__, body_name, stub_name))
+    errors = __conformance_errors(aClass)
 
     if errors:
         print("assert_implements(%s) errors:" % aClass.__name__)
         for e in errors: print("  ", e)
         raise InterfaceError("(assert_implements): failed for %s" % aClass.__name__)
-    elif interface_list:
+    elif interfaces(aClass):
         # Since interfaces don't implement other interfaces (they only extend them),
         # `aClass' must be a regular class, so disable the interface attribute.
         aClass.interface_flag = False
@@ -270,6 +331,19 @@ def assert_implements(aClass):
         return False
 
 
+def check_implements(aClass):
+    """
+    Return: None if `aClass' implements all of its interfaces, else a string giving each
+            non-conformance issue on a separate line.
+    Unlike "assert_implements", this neither prints nor raises an exception when `aClass'
+    fails to conform, so it may be used as a predicate, e.g. in validation loops.
+    Raise: TypeError if `aClass' is not a class
+    """
+    if not (isclass(aClass) or is_interface(aClass)):
+        raise TypeError("(check_implements): aClass arg `%s' is not a class" % aClass)
+    return "\n".join(__conformance_errors(aClass)) or None
+
+
 def extends(interface, *interfaces):
     """
     Return: True if `interface' inherits from all interfaces in `interfaces', else False.
@@ -277,13 +351,16 @@ def extends(interface, *interfaces):
     """
     if not is_interface(interface):
         raise TypeError('(extends): first arg %s must be an interface; try using "implements" instead' % interface)
-    if False in map(is_interface, interfaces):
+    if not all(map(is_interface, interfaces)):
         raise TypeError('(extends): some arg from interfaces is not an interface: %s' % interfaces)
-    return all([issubclass(interface, anc_interface) for anc_interface in interfaces])
+    return all(issubclass(interface, anc_interface) for anc_interface in interfaces)
 
 
 def implements(obj, *interfaces):
-    "Return: True if obj (a class or instance) implements all interfaces in `interfaces', else False."
+    """
+    Return: True if obj (a class or instance) implements all interfaces in `interfaces', else False.
+    This is False if any of `interfaces' is not an interface.
+    """
     if isclass(obj):
         return __class_implements(obj, interfaces)
     elif isinstance(obj, object):
@@ -299,8 +376,7 @@ def implements(obj, *interfaces):
 def interface_body_name(imethod_name):
     "Return: the name of the body method for interface method `imethod_name'."
     if type(imethod_name) != str:
-        raise TypeError("(%s.body_name): `imethod_name' must be a string: %s" % \
-              (self.__name__, imethod_name))
+        raise TypeError("(interface_body_name): `imethod_name' must be a string: %s" % imethod_name)
     if len(imethod_name) < 3 or imethod_name[-2:] != "__":
         return imethod_name + "_body"
     else:
@@ -311,7 +387,7 @@ def interface_names(obj):
     """
     Return: a list of interface names to which `obj' is conformant.
     The list begins with `obj' itself if it is an interface.
-    Names are returned in depth-first order, left to right.
+    Names are returned in method resolution order.
     """
     return [o.__name__ for o in interfaces(obj)]
 
@@ -320,12 +396,13 @@ def interfaces(obj):
     """
     Return: a list of interface objects to which `obj' conforms.
     The list begins with `obj' itself if it is an interface.
-    Interfaces are returned in depth-first order, left to right.
+    Interfaces are returned in method resolution order.
     """
     if not isclass(obj) and isinstance(obj, object):
         obj = obj.__class__
     if isclass(obj) or is_interface(obj):
-        return [i for i in ancestors(obj) if is_interface(i)]
+        # Filter the MRO in one pass rather than copying it with "ancestors" first.
+        return [i for i in obj.__mro__ if Interface in i.__mro__]
     else:
         # !!! Later will have to add support for Python builtin types.
         # For now, just return None
@@ -336,7 +413,47 @@ def is_interface(obj):
     """
     Return: True if `obj' is an interface or class of interface (inherits from Interface and contains stub methods), else False.
     """
-    return issubclass(obj, Interface) if isclass(obj) else getattr(obj, 'interface_flag', False)
+    # Test MRO membership directly rather than with issubclass(), which goes
+    # through InterfaceMeta's inherited __subclasscheck__.
+    return Interface in obj.__mro__ if isclass(obj) else getattr(obj, 'interface_flag', False)
+
+
+def native_body(signature):
+    """
+    Return: a decorator which compiles a body method to a native C callback with "numba.cfunc".
+    Require: the numba package is installed; the decorated function omits `self' and uses
+             only the argument and result types given by `signature', e.g. "float64(float64)".
+
+    Use this for numeric bodies of stubs declared as (iself, *args), such as
+    "Callable.__call__", which C code calls many times over.  The decorator returns
+    a body method which ignores `self' and calls the original Python function, so
+    Python callers are unaffected; the compiled callback is stored as the body's
+    `native' attribute, whose `address' and `ctypes' attributes let C callers invoke
+    the body directly, without boxing each argument into a Python object, and
+    `signature' is stored as its `signature' attribute.
+    """
+    # numba is an optional dependency needed only by native bodies.
+    from numba import cfunc
+    from functools import wraps
+
+    def decorator(function):
+        def body(self, *args):
+            return function(*args)
+        body = wraps(function)(body)
+        body.native = cfunc(signature)(function)
+        body.signature = signature
+        return body
+    return decorator
+
+def plain_stub(stub):
+    """
+    Mark interface `stub' as having no pre- or post-conditions, for use as a decorator.
+    Return: `stub'
+    InterfaceMeta then replaces `stub' in each implementor which defines its body
+    method with the body itself; only stubs so marked are ever replaced.
+    """
+    stub.plain = True
+    return stub
 
 ## -----
 
@@ -344,7 +461,7 @@ def is_interface(obj):
 def ancestor_names(obj, exclude_interfaces=0):
     """
     Return: a list of ancestor class or interface names of `obj', starting with `obj' itself.
-    Ancestors are returned in depth-first order, left to right.
+    Ancestors are returned in method resolution order, i.e. that of `obj.__mro__'.
     With optional `exclude_interfaces', interface ancestors are removed.
     """
     return [a.__name__ for a in ancestors(obj, exclude_interfaces)]
@@ -353,7 +470,7 @@ def ancestor_names(obj, exclude_interfaces=0):
 def ancestors(obj, exclude_interfaces=0):
     """
     Return: a list of ancestor class and interface objects of `obj', starting with `obj' itself.
-    Ancestors are returned in depth-first order, left to right.
+    Ancestors are returned in method resolution order, i.e. that of `obj.__mro__'.
     With optional `exclude_interfaces', interface ancestors are removed.
     """
     assert isclass(obj) or is_interface(obj) or isinstance(obj, object), \
@@ -363,139 +480,360 @@ def ancestors(obj, exclude_interfaces=0):
         obj = obj.__class__
 
     if exclude_interfaces:
-        repeated_ancestors = __get_ancestors_no_interfaces(obj)
+        return [c for c in obj.__mro__ if not is_interface(c)]
     else:
-        repeated_ancestors = __get_ancestors(obj)
-
-    return list(set(repeated_ancestors))
+        return list(obj.__mro__)
 
 
 def flatten (*objs):
     """
     Return: a single-level list of all atoms in `*objs' in original order.
     Any object type other than a sequence, dictionary or Indexable type is considered atomic
-    by this function.
-
-    SeeAlso: `sys.setrecursionlimit' to increase recursion limit if need be.
+    by this function; None values are omitted.
     """
     ## Test case:   flatten(('a', 'b', ('c', 'd')), 'e', ('f', ('g', ['h', ('i', 'j'), ['k', 'l', 'm']], ('n'))))
     ## Should produce: => (a b c d e f g h i j k l m n)
-    if len(objs) == 1: objs = objs[0]
-    if objs in (None, (), [], {}, set()):
-        return []
-    elif type(objs) in (tuple, list, set, slice):
+    # Walk the nesting with an explicit stack of pending objects, last one first,
+    # rather than by recursion, so each object is visited once without slicing.
+    atoms = []
+    stack = list(reversed(objs))
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, (tuple, list)):
 # !!!     Add next line after Indexable interface is defined and loaded:
-#         or implements(objs, Indexable):
-        if objs in (None, (), [], set()):
-            return []
-        else:
-            return flatten(objs[0]) + flatten(objs[1:])
-    elif type(objs) is dict:
-        return flatten(objs.values())
-    else:
-        return [objs]
+#         or implements(obj, Indexable):
+            stack.extend(reversed(obj))
+        elif isinstance(obj, set):
+            stack.extend(reversed(list(obj)))
+        elif isinstance(obj, dict):
+            stack.extend(reversed(list(obj.values())))
+        elif obj is not None:
+            atoms.append(obj)
+    return atoms
 
 
 def unique(*sequences):
     """
     Return: a flattened list with duplicates removed from any number of atomic or `sequence' args.
-    Do not sort the elements.
+    Do not sort the elements; the first occurrence of each is kept in original order.
     """
-    return list(set(flatten(*sequences)))
+    return list(dict.fromkeys(flatten(*sequences)))
 
 ## ------------------------------------------------------------------------
 ## Private functions
 ## ------------------------------------------------------------------------
 
+def _affects_conformance(aClass, name, value):
+    """
+    Return: True if binding attribute `name' of `aClass' to `value', or deleting it, may change
+            which interfaces `aClass' and its subclasses implement, else False.
+    Only body methods and the attributes which interfaces declare as stubs do.
+    """
+    return _interface_stub_name(name) is not None or _is_stub(value) \
+        or any(_is_stub(cls.__dict__.get(name)) for cls in aClass.__mro__)
+
+
 def __class_implements(aClass, interface_seq):
     "Return: True if `aClass' implements all interfaces in `interface_seq', else False."
+    # Nothing implements a non-interface.
+    if not all(map(is_interface, interface_seq)):
+        return False
     # Add all ancestor interfaces to the implementation check
-    if interface_seq:
-        interface_seq = unique(interfaces(*interface_seq))
-    for interface in interface_seq:
-        if not is_interface(interface):
-            raise TypeError( \
-                  "(__class_implements): aClass arg = `%s', interface arg `%s' must be an Interface" % \
-                  (aClass.__name__, interface))
-        if not (issubclass(aClass, interface) and __implements(aClass, interface)):
+    for interface in __expand_interfaces(interface_seq):
+        if not __implements(aClass, interface):
             return False
 
     return True
 
 
-def __get_ancestors(aClass):
-    if aClass in (None, (), [], {}, set()):
-        return []
-    else:
-        return [aClass] + flatten([__get_ancestors(c) for c in aClass.__bases__])
+def _bool_from_len(self):
+    "Return: False if `self' has a length of zero, else True, as Python does for objects without __bool__."
+    return len(self) != 0
 
 
-def __get_ancestors_no_interfaces(aClass):
-    if aClass in (None, (), [], {}, set()) or is_interface(aClass):
+def __conformance_errors(aClass):
+    "Return: a list of messages describing each way in which `aClass' fails to implement its interfaces."
+    interface_list = interfaces(aClass)
+    # Most classes conform, so first confirm that with the memoized check, which stops
+    # at the first problem; only walk every stub to describe the problems when it fails.
+    # Drop the results of `aClass' beforehand, since a mixin's body may have been
+    # rebound since they were memoized; the fresh results stay memoized for later
+    # calls to "implements".
+    _implements_cache.pop(aClass, None)
+    if all(__implements(aClass, interface) for interface in interface_list):
         return []
-    else:
-        return [aClass] + flatten([__get_ancestors_no_interfaces(c) for c in aClass.__bases__])
+
+    errors = []
+    # Add all ancestor interfaces to the implementation check
+    for interface in interface_list:
+        # Ensure all interface stub methods are redefined by the current class
+        # and that the number of arguments to each remains the same.
+        for stub_name, stub_method, stub_argcount, body_name in __interface_stubs(interface):
+            impl_method = getattr(aClass, stub_name, _MISSING)
+            body_method = getattr(aClass, body_name, _MISSING)
+            if impl_method is _MISSING:
+                if body_method is _MISSING:
+                    errors.append("(%s): failed to define %s interface method %s or %s" % \
+                                  (aClass.__name__, interface.__name__, body_name, stub_name))
+                continue
+            if body_method is _MISSING:
+                body_method = None
+            try:
+                body_method_unimplemented = body_method and _is_unimplemented(body_method) \
+                                            or issubclass(interface, body_method.__class__)
+                if impl_method is stub_method and not body_method or body_method_unimplemented:
+                    # method is not implemented
+                    errors.append("(%s): failed to define %s interface method %s or %s" % \
+                                  (aClass.__name__, interface.__name__, body_name, stub_name))
+
+                # Read argument counts only where they must be compared: an inherited
+                # stub trivially matches itself and an unimplemented body is not checked.
+                if impl_method is stub_method:
+                    impl_method_argcount = stub_argcount
+                else:
+                    impl_method_argcount = impl_method.__code__.co_argcount
+                if stub_argcount is not None and impl_method_argcount != stub_argcount:
+                    # impl_method has wrong number of args; name the body if InterfaceMeta
+                    # installed it as the stub, since that is the method the implementor wrote.
+                    impl_name = body_name if impl_method is body_method else stub_name
+                    errors.append("(%s.%s): takes %d args, instead of %d specified by %s.%s" % \
+                                  (aClass.__name__, impl_name, impl_method_argcount, \
+                                   stub_argcount, interface.__name__, impl_name))
+                elif body_method and not body_method_unimplemented:
+                    body_argcount = body_method.__code__.co_argcount
+                    if stub_argcount is not None and body_argcount != stub_argcount:
+                        # body_method has wrong number of args
+                        errors.append("(%s.%s): takes %d args, instead of %d specified by %s.%s" % \
+                                      (aClass.__name__, body_name, body_argcount,
+                                       stub_argcount, interface.__name__, body_name))
+
+            except AttributeError:
+                # A stub or body which is not a function has no argument count to check.
+                errors.append("(%s): %s interface method %s or %s is not a function" % \
+                              (aClass.__name__, interface.__name__, body_name, stub_name))
+
+    if not errors:
+        # Never report conformance when the memoized check has found a problem.
+        errors = ["(%s): fails to implement %s interface" % (aClass.__name__, interface.__name__)
+                  for interface in interface_list if not __implements(aClass, interface)]
+    return errors
+
+
+def __dedupe_classes(classes):
+    """
+    Return: a list of the classes in iterable `classes' with duplicates removed, keeping the first occurrence of each in order.
+    Unlike "unique", does not flatten its argument; classes hash by identity, so a dict's keys dedupe them in order.
+    """
+    return list(dict.fromkeys(classes))
+
+
+def __expand_interfaces(interface_seq):
+    "Return: a list of the interfaces in `interface_seq' followed by their ancestor interfaces, without duplicates."
+    return __dedupe_classes(anc_interface for interface in interface_seq
+                            for anc_interface in interfaces(interface) or ())
+
+
+def _forget_conformance(aClass):
+    "Drop the memoized conformance results and stub methods of `aClass' and its subclasses."
+    _stub_cache.pop(aClass, None)
+    # A class just being defined has neither subclasses nor results yet.
+    if aClass in _implements_cache or type.__subclasses__(aClass):
+        for cached_class in [c for c in _implements_cache if aClass in c.__mro__]:
+            del _implements_cache[cached_class]
+
+
+def __implements(aClass, interface):
+    """
+    Return: True if `aClass' inherits from and implements `interface', else False.
+    Results are memoized in `_implements_cache'; an instance conforms to an interface
+    iff its class does, so instances are checked via their classes.
+    """
+    try:
+        return _implements_cache[aClass][interface]
+    except KeyError:
+        # Memoize only results for ancestors of `aClass', which it keeps alive anyway;
+        # a memoized unrelated interface could never be garbage collected.
+        if not issubclass(aClass, interface):
+            return False
+        result = __implements_stubs(aClass, interface)
+        _implements_cache.setdefault(aClass, {})[interface] = result
+        return result
 
 
-def __implements(obj, interface):
-    idict = interface.__dict__
+def __implements_stubs(aClass, interface):
+    "Return: True if `aClass' implements all stub methods of `interface', else False."
+    istub_tuples = __interface_stubs(interface)
 
     # To be an interface implementor, either the interface has no methods
     # to implement (e.g. Interface) or a class must implement at least one
-    # of the interface's methods.  This flag tracks whether `obj' has done so.
+    # of the interface's methods.  This flag tracks whether `aClass' has done so.
     implemented_a_method = False
 
-    # Set istub_tuples to interface's stub methods given as (name, method) tuples.
-    # Remove non-stub attributes
-    istub_tuples = [item for item in idict.items() \
-                    if type(item[1]) is FunctionType and \
-                    item[1].__code__.co_varnames[0] is 'iself']
-
     # Ensure all interface stub methods are redefined by the current class
     # and that the number of arguments to each remains the same.
     try:
-        for stub_name, stub_method in istub_tuples:
-            impl_method = getattr(obj, stub_name)
-            body_name = interface_body_name(stub_name)
-            if hasattr(obj, body_name):
-                body_method = getattr(obj, body_name)
-                body_argcount = body_method.__code__.co_argcount
-            else:
-                body_method = body_argcount = None
+        for stub_name, stub_method, stub_argcount, body_name in istub_tuples:
+            impl_method = getattr(aClass, stub_name, _MISSING)
+            if impl_method is _MISSING:
+                return False
+            body_method = getattr(aClass, body_name, _MISSING)
+            if body_method is _MISSING:
+                body_method = None
 
-            body_method_unimplemented = body_method and body_method is Interface.error \
+            body_method_unimplemented = body_method and _is_unimplemented(body_method) \
                                         or issubclass(interface, body_method.__class__)
-            if impl_method == stub_method and not body_method or body_method_unimplemented:
+            if impl_method is stub_method and not body_method or body_method_unimplemented:
                 # method is not implemented
                 return False
             else:
                 implemented_a_method = True
-            
-            impl_method_argcount = impl_method.__code__.co_argcount
-            stub_argcount = stub_method.__code__.co_argcount
-            if impl_method != stub_method and \
-               impl_method_argcount != stub_argcount or \
-               body_method and not body_method_unimplemented and \
-               body_argcount != stub_argcount:
-                # method has wrong number of args
-                return False
+
+            # Read argument counts only where they must be compared: an inherited
+            # stub trivially matches itself and an unimplemented body was rejected above.
+            # Each read also rejects a stub or body which is not a function.
+            if impl_method is not stub_method:
+                impl_method_argcount = impl_method.__code__.co_argcount
+                if stub_argcount is not None and impl_method_argcount != stub_argcount:
+                    # method has wrong number of args
+                    return False
+            if body_method:
+                body_argcount = body_method.__code__.co_argcount
+                if stub_argcount is not None and body_argcount != stub_argcount:
+                    # method has wrong number of args
+                    return False
     except AttributeError:
+        # A stub or body which is not a function.
         return False
 
     return not istub_tuples or implemented_a_method
 
 
+def __interface_stubs(interface):
+    """
+    Return: a tuple of (stub_name, stub_method, stub_argcount, body_name) entries for the stub methods
+            which `interface' itself declares.
+    `stub_argcount' is None for a stub which takes *args, since implementations of any arity conform to it.
+    Results are memoized in `_stub_cache'.
+    """
+    try:
+        return _stub_cache[interface]
+    except KeyError:
+        stubs = _stub_cache[interface] = tuple(
+            (name, method, None if method.__code__.co_flags & CO_VARARGS else method.__code__.co_argcount,
+             interface_body_name(name))
+            for name, method in interface.__dict__.items() if _is_stub(method))
+        return stubs
+
+
 def __instance_implements(instance, interface_seq):
     "Return: True if `instance' implements `interface_seq', else False."
+    # Nothing implements a non-interface.
+    if not all(map(is_interface, interface_seq)):
+        return False
     # Add all ancestor interfaces to the implementation check
-    if interface_seq:
-        interface_seq = unique(interfaces(*interface_seq))
-    for interface in interface_seq:
-        if not is_interface(interface):
-            raise TypeError( \
-                  "(__instance_implements): instance arg = `%s', interface arg `%s' must be an Interface" % \
-                  (instance, interface))
-        if not (isinstance(instance, interface) and __implements(instance, interface)):
+    for interface in __expand_interfaces(interface_seq):
+        if not __implements(instance.__class__, interface):
             return False
 
     return True
+
+
+def _install_bodies(aClass):
+    """
+    Replace each interface stub inherited by `aClass' with the body method that `aClass' defines for it.
+    Stubs which `aClass' or an intervening ancestor has overridden are left alone.
+    """
+    for body_name, body_method in list(aClass.__dict__.items()):
+        _install_body(aClass, body_name, body_method)
+
+
+def _install_body(aClass, body_name, body_method):
+    """
+    If `body_method' named `body_name' implements an interface stub inherited by `aClass', replace the stub with it.
+    Stubs which `aClass' or an intervening ancestor has overridden are left alone.
+    """
+    stub_name = _interface_stub_name(body_name)
+    if not stub_name or stub_name in aClass.__dict__ or not _is_function(body_method) \
+       or _is_unimplemented(body_method):
+        return
+    # Find the stub which `aClass' inherits, passing over ancestors whose stubs
+    # were already replaced by their own bodies.
+    for owner in aClass.__mro__[1:]:
+        if stub_name not in owner.__dict__:
+            continue
+        inherited = owner.__dict__[stub_name]
+        if inherited is owner.__dict__.get(body_name):
+            continue
+        if _is_stub(inherited) and getattr(inherited, 'plain', False):
+            # Bypass InterfaceMeta.__setattr__: binding the body itself already
+            # invalidated any conformance results which this could change.
+            type.__setattr__(aClass, stub_name, body_method)
+        return
+
+
+def _is_function(obj):
+    """
+    Return: True if `obj' is a function defined with "def" or "lambda", else False.
+    Functions compiled by Cython, e.g. those of this module when it is compiled, count too.
+    """
+    return type(obj) is FunctionType or type(obj).__name__ == 'cython_function_or_method'
+
+
+def _is_stub(method):
+    """
+    Return: True if `method' is an interface stub method, i.e. a function whose first argument is `iself', else False.
+    Compare by value, not identity: string interning is an interpreter detail.
+    """
+    return _is_function(method) and bool(method.__code__.co_varnames) \
+        and method.__code__.co_varnames[0] == 'iself'
+
+
+def _is_unimplemented(body_method):
+    "Return: True if `body_method' is the error method of a body which no implementor has defined, else False."
+    return body_method is Interface.error or getattr(body_method, 'unimplemented', False) is True
+
+
+def _interface_stub_name(body_name):
+    "Return: the name of the interface stub method whose body method is `body_name', else None."
+    if body_name.endswith("_body__"):
+        stub_name = body_name[:-7] + "__"
+    elif body_name.endswith("_body"):
+        stub_name = body_name[:-5]
+    else:
+        return None
+    return stub_name if interface_body_name(stub_name) == body_name else None
+
+
+def _unimplemented_body(interface, body_name):
+    "Return: an error method for body `body_name' of `interface', raising an InterfaceError which names the method."
+    # Format all but the implementor's name now rather than on each call.
+    message = "(%%s): failed to implement %s interface method %s or %s" \
+              % (interface.__name__, body_name, _interface_stub_name(body_name) or body_name)
+    def error(self, *unused):
+        raise InterfaceError(message % type(self).__name__)
+    # Name the code object too, so tracebacks show the body which was not implemented.
+    # Compiled (Cython) functions have no replaceable code object.
+    if type(error) is FunctionType:
+        error.__code__ = error.__code__.replace(co_name=body_name)
+    error.__name__ = body_name
+    error.__qualname__ = "%s.%s" % (interface.__qualname__, body_name)
+    error.unimplemented = True
+    return error
+
+
+def _uninstall_body(aClass, body_name):
+    """
+    If "_install_body" replaced a stub of `aClass' with body `body_name', restore the inherited stub.
+    Return: True if the body is a replaceable one, i.e. it names an interface stub which `aClass' has
+            not otherwise overridden, else False.
+    """
+    stub_name = _interface_stub_name(body_name)
+    if not stub_name:
+        return False
+    installed = aClass.__dict__.get(stub_name)
+    if installed is None:
+        return True
+    if installed is aClass.__dict__.get(body_name):
+        type.__delattr__(aClass, stub_name)
+        return True
+    return False